@@ -47,6 +47,8 @@ class TableLimitError(Exception):
 class Player(SimplePlayer):
     """A player in a game of Blackjack."""
 
+    hand_class = BlackjackHand
+
     def __init__(
         self,
         name: str,
@@ -66,11 +68,9 @@ class Player(SimplePlayer):
         self.insurance = 0
         self.total_bets = 0
         self.total_winnings = 0
-        self.hands = [BlackjackHand()]
         self.done = False
         self.blackjack = False
         self.winner = []
-        self.current_hand_index = 0
         self.hand_done = [False]
         self.split_hands = [False]
         self.must_stand_after_hit = False
@@ -297,11 +297,10 @@ class Player(SimplePlayer):
         # Check for bust after adding card
         if self.current_hand.value() > 21:
             self.hand_done[self.current_hand_index] = True
-        self._cached_value = None
 
     def reset(self):
         """Resets the player's state."""
-        self.hands = [BlackjackHand()]
+        self.hands = [self.hand_class()]
         self.bets = []
         self.done = False
         self.blackjack = False
@@ -319,9 +318,10 @@ class Player(SimplePlayer):
 class Dealer(SimplePlayer):
     """A dealer in a game of Blackjack."""
 
+    hand_class = BlackjackHand
+
     def __init__(self, name: str, io_interface: IOInterface):
         super().__init__(name, io_interface, initial_money=0)
-        self.hands = [BlackjackHand()]
         self.winner = None
 
     @property
@@ -353,5 +353,5 @@ class Dealer(SimplePlayer):
 
     def reset(self):
         """Resets dealer's state."""
-        self.hands = [BlackjackHand()]
+        self.hands = [self.hand_class()]
         self.winner = None
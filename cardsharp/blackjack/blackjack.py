@@ -19,9 +19,7 @@ import time
 import cProfile
 import pstats
 import io
-import matplotlib.pyplot as plt
 import threading
-from copy import deepcopy
 
 from cardsharp.blackjack.actor import Dealer, Player
 from cardsharp.blackjack.state import (
@@ -50,6 +48,9 @@ class BlackjackGraph:
         self.games = []
         self.net_earnings = []
 
+        # pyplot is slow to import, so only load it when a graph is shown
+        import matplotlib.pyplot as plt
+
         plt.ion()  # Turn on interactive mode
         self.fig, self.ax = plt.subplots()
         (self.line,) = self.ax.plot([], [], "b-")
@@ -84,6 +85,8 @@ class MultiStrategyBlackjackGraph:
         self.strategies = strategies
         self.data = {strategy: {"games": [], "earnings": []} for strategy in strategies}
 
+        import matplotlib.pyplot as plt
+
         plt.ion()  # Turn on interactive mode
         self.fig, self.ax = plt.subplots(figsize=(12, 6))
         self.lines = {
@@ -161,13 +164,25 @@ class BlackjackGame:
         self.visible_cards = []
         self.minimum_players = 1
 
+    @property
+    def minimum_players(self):
+        """Number of players required before the first round starts."""
+        return self._minimum_players
+
+    @minimum_players.setter
+    def minimum_players(self, value):
+        self._minimum_players = value
+        if isinstance(self.current_state, WaitingForPlayersState):
+            self.current_state.players_changed()
+
     def add_visible_card(self, card):
         """Add a card to the list of visible cards."""
         self.visible_cards.append(card)
 
     def set_state(self, state):
         """Change the current state of the game."""
-        self.io_interface.output(f"Changing state to {state}.")
+        if not self.io_interface.discards_output:
+            self.io_interface.output(f"Changing state to {state}.")
         self.current_state = state
 
     def add_player(self, player):
@@ -242,6 +257,14 @@ class BlackjackGame:
         return self.rules.get_bonus_payout(card_combination)
 
 
+# Strategy class for each --strat name; anything else plays basic strategy
+_STRATEGIES_BY_NAME = {
+    "count": CountingStrategy,
+    "aggro": AggressiveStrategy,
+    "martin": MartingaleStrategy,
+}
+
+
 def create_io_interface(args):
     """Create the IO interface based on the command line arguments."""
     strategy = None
@@ -251,17 +274,7 @@ def create_io_interface(args):
         io_interface = LoggingIOInterface(args.log_file)
     elif args.simulate:
         io_interface = DummyIOInterface()
-        if args.strat:
-            if args.strat == "count":
-                strategy = CountingStrategy()
-            elif args.strat == "aggro":
-                strategy = AggressiveStrategy()
-            elif args.strat == "martin":
-                strategy = MartingaleStrategy()
-            else:
-                strategy = BasicStrategy()
-        else:
-            strategy = BasicStrategy()
+        strategy = _STRATEGIES_BY_NAME.get(args.strat, BasicStrategy)()
     else:
         io_interface = ConsoleIOInterface()
         strategy = BasicStrategy()
@@ -389,8 +402,8 @@ def run_strategy_analysis(args, rules):
             rules, DummyIOInterface(), player_names, BasicStrategy(), initial_shoe
         )
 
-        # Reset shoe to state after recording
-        initial_shoe = deepcopy(current_shoe_state)
+        # The recording game advanced initial_shoe in place and returned it
+        # as current_shoe_state; only the replays need their own copies
 
         for strategy_name, strategy in strategies.items():
             earnings, total_bets, result = replay_game_with_strategy(
@@ -398,7 +411,7 @@ def run_strategy_analysis(args, rules):
                 DummyIOInterface(),
                 player_names,
                 strategy,
-                deepcopy(current_shoe_state),  # Use the recorded shoe state
+                current_shoe_state.copy(),  # Use the recorded shoe state
             )
 
             results[strategy_name]["net_earnings"] += earnings
@@ -442,6 +455,8 @@ def run_strategy_analysis(args, rules):
     print(f"Worst Performing Strategy: {worst_strategy}")
 
     if args.vis:
+        import matplotlib.pyplot as plt
+
         plt.ioff()
         plt.show()  # Keep the graph window open after simulation ends
 
@@ -609,13 +624,6 @@ def main():
 
         games_played_excluding_pushes = total_games_played - total_draws
 
-        if games_played_excluding_pushes != 0:
-            player_wins_ratio = total_player_wins / games_played_excluding_pushes
-            dealer_wins_ratio = total_dealer_wins / games_played_excluding_pushes
-        else:
-            player_wins_ratio = 0
-            dealer_wins_ratio = 0
-
         if total_bets > 0:
             house_edge = (
                 -net_earnings / total_bets
@@ -636,6 +644,8 @@ def main():
         print(f"Games simulated per second: {games_per_second:,.2f}")
 
         if graph:
+            import matplotlib.pyplot as plt
+
             plt.ioff()
             plt.show()  # Keep the graph window open after simulation ends
 
@@ -10,7 +10,7 @@ from cardsharp.common.hand import Hand
 class BlackjackHand(Hand):
     """A hand in the game of Blackjack with optimized caching."""
 
-    __slots__ = ("_cards", "_cache", "_is_split")
+    __slots__ = ("_cache", "_is_split")
 
     def __init__(self, *args, is_split: bool = False, **kwargs):
         """Initialize a BlackjackHand with an optimized cache system."""
@@ -28,14 +28,11 @@ class BlackjackHand(Hand):
 
     def _invalidate_cache(self) -> None:
         """Invalidate only necessary cache entries."""
-        self._cache.update(
-            {
-                "value": None,
-                "is_soft": None,
-                "is_blackjack": None,
-                "last_card_count": len(self._cards),
-            }
-        )
+        cache = self._cache
+        cache["value"] = None
+        cache["is_soft"] = None
+        cache["is_blackjack"] = None
+        cache["last_card_count"] = len(self._cards)
         # Don't invalidate 'num_aces' and 'non_ace_value' unless necessary
 
     def add_card(self, card: Card) -> None:
@@ -124,11 +121,11 @@ class BlackjackHand(Hand):
             self._cache["is_blackjack"] = False
             return False
 
-        ranks = {card.rank for card in self._cards}
-        has_ace = Rank.ACE in ranks
-        has_ten_value = any(rank.rank_value == 10 for rank in ranks)
-
-        self._cache["is_blackjack"] = has_ace and has_ten_value
+        # Only an ace (11) and a ten-value card (10) sum to 21 with two cards
+        first, second = self._cards
+        self._cache["is_blackjack"] = (
+            first.rank.rank_value + second.rank.rank_value == 21
+        )
         return self._cache["is_blackjack"]
 
     @property
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from cardsharp.common.hand import Hand
 
 
@@ -19,7 +21,7 @@ class Rules:
         dealer_peek: bool = False,
         use_csm: bool = False,
         allow_early_surrender: bool = False,
-        bonus_payouts: dict = {},
+        bonus_payouts: Optional[dict] = None,
         time_limit: int = 0,
         max_splits: int = 3,
     ):
@@ -70,7 +72,7 @@ class Rules:
             surrender is allowed. Defaults to False.
 
             bonus_payouts (dict, optional): Dictionary defining bonus payouts
-            for specific card combinations. Defaults to an empty dictionary.
+            for specific card combinations. Defaults to no bonus payouts.
 
             time_limit (int, optional): Time limit in seconds for player
             decisions. Defaults to 0 (no time limit).
@@ -21,14 +21,13 @@ the next state. Each game state class also overrides the str method to return
 the state name.
 """
 
-import time
+import threading
 
 from abc import ABC
 from abc import abstractmethod
 
 from cardsharp.common.card import Rank
 from cardsharp.blackjack.action import Action
-from cardsharp.common.io_interface import DummyIOInterface
 
 
 class InsufficientFundsError(Exception):
@@ -55,22 +54,40 @@ class WaitingForPlayersState(GameState):
     The game state while the game is waiting for players to join.
     """
 
+    def __init__(self):
+        self._player_joined = threading.Condition()
+
     def handle(self, game):
         """
-        Continuously checks if the minimum number of players have joined.
-        If so, it changes the game state to PlacingBetsState.
+        Waits until the minimum number of players have joined, then
+        changes the game state to PlacingBetsState.
+
+        The wait is re-checked whenever a player joins through add_player or
+        the game's minimum_players is changed, both of which call
+        players_changed.
         """
-        while len(game.players) < game.minimum_players:
-            time.sleep(1)
+        with self._player_joined:
+            self._player_joined.wait_for(
+                lambda: len(game.players) >= game.minimum_players
+            )
         game.set_state(PlacingBetsState())
 
     def add_player(self, game, player):
         """
-        Adds a player to the game and notifies the interface.
+        Adds a player to the game, wakes up any waiting handler and notifies the interface.
         """
-        game.players.append(player)
+        with self._player_joined:
+            game.players.append(player)
+            self._player_joined.notify_all()
         game.io_interface.output(f"{player.name} has joined the game.")
 
+    def players_changed(self):
+        """
+        Wakes up any waiting handler so it re-checks the player count.
+        """
+        with self._player_joined:
+            self._player_joined.notify_all()
+
 
 class PlacingBetsState(GameState):
     """
@@ -111,13 +128,18 @@ class DealingState(GameState):
         """
         Handles the card dealing and notifies the interface.
         """
+        dealer = game.dealer
+        seats = game.players + [dealer]
+        deal_card = game.shoe.deal
+        output = game.io_interface.output
+        announce = not game.io_interface.discards_output
         for _ in range(2):
-            for player in game.players + [game.dealer]:
-                card = game.shoe.deal()
+            for player in seats:
+                card = deal_card()
                 player.add_card(card)
                 game.add_visible_card(card)
-                if player != game.dealer:
-                    game.io_interface.output(f"Dealt {card} to {player.name}.")
+                if announce and player is not dealer:
+                    output(f"Dealt {card} to {player.name}.")
 
     def check_blackjack(self, game):
         """Checks for blackjack for dealer and players, handles payouts appropriately."""
@@ -199,12 +221,10 @@ class OfferInsuranceState(GameState):
             for player in game.players:
                 self.offer_insurance(game, player)
 
-        dealer_has_blackjack = False
         # Check for dealer blackjack if dealer peeking is allowed
         if game.rules.should_dealer_peek():
             if dealer_up_card.rank == Rank.ACE or dealer_up_card.rank.rank_value == 10:
                 if game.dealer.current_hand.is_blackjack:
-                    dealer_has_blackjack = True
                     self.handle_dealer_blackjack(game)
                     game.set_state(EndRoundState())
                     return
@@ -315,19 +335,18 @@ class PlayersTurnState(GameState):
                         break  # Exit the loop if player is busted or done
         game.set_state(DealersTurnState())
 
+    @staticmethod
+    def _is_split_ace(hand):
+        """Returns True if the hand came from a split and holds an ace."""
+        return hand.is_split and any(card.rank == Rank.ACE for card in hand.cards)
+
     def get_valid_actions(self, game, player, hand_index):
         """Returns valid actions for the player's current hand, considering game rules."""
         valid_actions = [Action.HIT, Action.STAND]
         hand = player.hands[hand_index]
 
         # Check if this is a split ace hand that already has two cards
-        is_split_ace = (
-            hand.is_split
-            and any(card.rank == Rank.ACE for card in hand.cards)
-            and len(hand.cards) >= 2
-        )
-
-        if is_split_ace:
+        if self._is_split_ace(hand) and len(hand.cards) >= 2:
             return [Action.STAND]  # Split aces can only stand after receiving one card
 
         if len(hand.cards) == 2:
@@ -354,17 +373,16 @@ class PlayersTurnState(GameState):
     def player_action(self, game, player, action):
         """Handles a player action with proper split hand tracking."""
 
-        player.action_history[player.current_hand_index].append(action)
+        hand_index = player.current_hand_index
+        hand = player.hands[hand_index]
+        player.action_history[hand_index].append(action)
 
+        # Actions are checked most common first
         if action == Action.HIT:
             # Check if this is a split ace hand before allowing the hit
-            if (
-                player.current_hand.is_split
-                and any(card.rank == Rank.ACE for card in player.current_hand.cards)
-                and len(player.current_hand.cards) > 1
-            ):
+            if self._is_split_ace(hand) and len(hand.cards) > 1:
                 game.io_interface.output(f"{player.name} cannot hit on split aces.")
-                player.hand_done[player.current_hand_index] = True
+                player.hand_done[hand_index] = True
                 return
 
             card = game.shoe.deal()
@@ -373,22 +391,39 @@ class PlayersTurnState(GameState):
             game.io_interface.output(f"{player.name} hits and gets {card}.")
 
             # Force stand on split aces after receiving one card
-            if (
-                player.current_hand.is_split
-                and any(card.rank == Rank.ACE for card in player.current_hand.cards)
-                and len(player.current_hand.cards) == 2
-            ):
-                player.hand_done[player.current_hand_index] = True
+            if self._is_split_ace(hand) and len(hand.cards) == 2:
+                player.hand_done[hand_index] = True
                 game.io_interface.output(
                     f"{player.name}'s split ace stands automatically."
                 )
             elif player.is_busted():
                 game.io_interface.output(f"{player.name} has busted.")
-                player.hand_done[player.current_hand_index] = True
+                player.hand_done[hand_index] = True
+
+        elif action == Action.STAND:
+            player.stand()
+            player.hand_done[hand_index] = True
+            game.io_interface.output(f"{player.name} stands.")
+
+        elif action == Action.DOUBLE:
+            # Prevent doubling down on split aces
+            if self._is_split_ace(hand):
+                game.io_interface.output(
+                    f"{player.name} cannot double down on split aces."
+                )
+                return
+
+            player.double_down()
+            card = game.shoe.deal()
+            player.hit(card)
+            game.add_visible_card(card)
+            game.io_interface.output(f"{player.name} doubles down and gets {card}.")
+            if player.is_busted():
+                game.io_interface.output(f"{player.name} has busted.")
+            player.hand_done[hand_index] = True
 
         elif action == Action.SPLIT:
-            curr_index = player.current_hand_index
-            is_splitting_aces = player.current_hand.cards[0].rank == Rank.ACE
+            is_splitting_aces = hand.cards[0].rank == Rank.ACE
 
             # Process the split using the player's split method
             player.split()
@@ -396,7 +431,7 @@ class PlayersTurnState(GameState):
             game.io_interface.output(f"{player.name} splits.")
 
             # Deal one card to each hand
-            for i in range(curr_index, curr_index + 2):
+            for i in range(hand_index, hand_index + 2):
                 card = game.shoe.deal()
                 player.hands[i].add_card(card)
                 game.add_visible_card(card)
@@ -409,34 +444,10 @@ class PlayersTurnState(GameState):
                         f"Split ace hand {i + 1} stands automatically."
                     )
 
-        elif action == Action.DOUBLE:
-            # Prevent doubling down on split aces
-            if player.current_hand.is_split and any(
-                card.rank == Rank.ACE for card in player.current_hand.cards
-            ):
-                game.io_interface.output(
-                    f"{player.name} cannot double down on split aces."
-                )
-                return
-
-            player.double_down()
-            card = game.shoe.deal()
-            player.hit(card)
-            game.add_visible_card(card)
-            game.io_interface.output(f"{player.name} doubles down and gets {card}.")
-            if player.is_busted():
-                game.io_interface.output(f"{player.name} has busted.")
-            player.hand_done[player.current_hand_index] = True
-
-        elif action == Action.STAND:
-            player.stand()
-            player.hand_done[player.current_hand_index] = True
-            game.io_interface.output(f"{player.name} stands.")
-
         elif action == Action.SURRENDER:
             player.surrender()
             game.io_interface.output(f"{player.name} surrenders.")
-            player.hand_done[player.current_hand_index] = True
+            player.hand_done[hand_index] = True
 
 
 class DealersTurnState(GameState):
@@ -461,7 +472,8 @@ class DealersTurnState(GameState):
         card = game.shoe.deal()
         game.dealer.add_card(card)
         game.add_visible_card(card)
-        game.io_interface.output(f"Dealer hits and gets {card}.")
+        if not game.io_interface.discards_output:
+            game.io_interface.output(f"Dealer hits and gets {card}.")
 
 
 class EndRoundState(GameState):
@@ -469,6 +481,13 @@ class EndRoundState(GameState):
     The game state where the round is ending.
     """
 
+    # Result message for each possible winner of a hand
+    _RESULT_MESSAGES = {
+        "dealer": "{name}'s hand {hand} loses. Dealer wins!",
+        "player": "{name}'s hand {hand} wins the round!",
+        "draw": "{name}'s hand {hand} and Dealer tie! It's a push.",
+    }
+
     def handle(self, game):
         """
         Handles the calculation of the winner, updates the statistics, and changes the game state to PlacingBetsState.
@@ -499,46 +518,43 @@ class EndRoundState(GameState):
 
     def output_results(self, game):
         """Outputs the results of the round."""
-        if isinstance(game.io_interface, DummyIOInterface):
-            return  # Short-circuit if the interface is a dummy
+        if game.io_interface.discards_output:
+            return  # Short-circuit if nothing would be shown
 
         dealer_hand_value = game.dealer.current_hand.value()
         dealer_cards = ", ".join(str(card) for card in game.dealer.current_hand.cards)
-        game.io_interface.output(f"Dealer's final cards: {dealer_cards}")
-        game.io_interface.output(f"Dealer's final hand value: {dealer_hand_value}")
+        # Collect the whole summary and hand it to the interface in one batch
+        messages = [
+            f"Dealer's final cards: {dealer_cards}",
+            f"Dealer's final hand value: {dealer_hand_value}",
+        ]
 
         for player in game.players:
             for hand_index, hand in enumerate(player.hands):
                 player_hand_value = hand.value()
                 player_cards = ", ".join(str(card) for card in hand.cards)
-                game.io_interface.output(
+                messages.append(
                     f"{player.name}'s hand {hand_index + 1} final cards: {player_cards}"
                 )
-                game.io_interface.output(
+                messages.append(
                     f"{player.name}'s hand {hand_index + 1} final hand value: {player_hand_value}"
                 )
-                winner = player.winner[hand_index]
-                if winner == "dealer":
-                    game.io_interface.output(
-                        f"{player.name}'s hand {hand_index + 1} loses. Dealer wins!"
-                    )
-                elif winner == "player":
-                    game.io_interface.output(
-                        f"{player.name}'s hand {hand_index + 1} wins the round!"
-                    )
-                elif winner == "draw":
-                    game.io_interface.output(
-                        f"{player.name}'s hand {hand_index + 1} and Dealer tie! It's a push."
+                result_message = self._RESULT_MESSAGES.get(player.winner[hand_index])
+                if result_message is not None:
+                    messages.append(
+                        result_message.format(name=player.name, hand=hand_index + 1)
                     )
 
+        game.io_interface.output_many(messages)
+
     def handle_payouts(self, game):
         """Handles the payouts for the round."""
         for player in game.players:
             for hand_index, hand in enumerate(player.hands):
-                winner = player.winner[hand_index]
                 bet_for_hand = player.bets[hand_index]
                 if bet_for_hand == 0:
                     continue  # Skip hands with no bet
+                winner = player.winner[hand_index]
                 if winner == "player":
                     if player.blackjack and not hand.is_split:
                         payout_multiplier = game.get_blackjack_payout()
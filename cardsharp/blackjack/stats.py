@@ -9,6 +9,8 @@ class SimulationStats:
     A class that holds the statistics of the simulation.
     """
 
+    __slots__ = ("games_played", "player_wins", "dealer_wins", "draws")
+
     def __init__(self):
         """
         Initializes the SimulationStats with default values.
@@ -7,6 +7,23 @@ from typing import Optional
 from cardsharp.blackjack.action import Action
 from cardsharp.common.card import Card, Rank
 
+# Strategy chart symbol to the Action it stands for
+_ACTION_SYMBOLS = {
+    "H": Action.HIT,
+    "S": Action.STAND,
+    "D": Action.DOUBLE,
+    "DS": Action.DOUBLE,
+    "P": Action.SPLIT,
+    "R": Action.SURRENDER,
+}
+
+# Decision used for chart cells that are missing
+_DEFAULT_DECISION = (Action.HIT, "H")
+
+# Hi-Lo card values that raise and lower the running count
+_LOW_CARD_VALUES = frozenset((2, 3, 4, 5, 6))
+_HIGH_CARD_VALUES = frozenset((10, 11))
+
 
 class Strategy(ABC):
     @abstractmethod
@@ -35,24 +52,36 @@ class DealerStrategy(Strategy):
 
 
 class BasicStrategy(Strategy):
+    # Column of each dealer up card in the strategy chart
+    dealer_indexes = {
+        "2": 0,
+        "3": 1,
+        "4": 2,
+        "5": 3,
+        "6": 4,
+        "7": 5,
+        "8": 6,
+        "9": 7,
+        "10": 8,
+        "A": 9,
+    }
+
+    # Parsed chart and resolved decisions for each strategy file, shared by
+    # every instance; simulations create a strategy per game
+    _charts = {}
+
     def __init__(self, strategy_file=None):
         if strategy_file is None:
             strategy_file = os.path.join(
                 os.path.dirname(__file__), "basic_strategy.csv"
             )
-        self.strategy = self._load_strategy(strategy_file)
-        self.dealer_indexes = {
-            "2": 0,
-            "3": 1,
-            "4": 2,
-            "5": 3,
-            "6": 4,
-            "7": 5,
-            "8": 6,
-            "9": 7,
-            "10": 8,
-            "A": 9,
-        }
+        chart = self._charts.get(strategy_file)
+        if chart is None:
+            self.strategy = self._load_strategy(strategy_file)
+            self._decisions = self._build_decisions()
+            self._charts[strategy_file] = (self.strategy, self._decisions)
+        else:
+            self.strategy, self._decisions = chart
 
     def _load_strategy(self, strategy_file):
         strategy = {}
@@ -65,6 +94,18 @@ class BasicStrategy(Strategy):
                 strategy[hand_type] = actions
         return strategy
 
+    def _build_decisions(self):
+        """Resolve every chart cell to its (action, symbol) pair up front."""
+        return {
+            (hand_type, dealer_card): self._resolve_decision(hand_type, dealer_card)
+            for hand_type in self.strategy
+            for dealer_card in self.dealer_indexes
+        }
+
+    def _resolve_decision(self, hand_type, dealer_card):
+        action_symbol = self._get_action_from_strategy(hand_type, dealer_card)
+        return self._map_action_symbol(action_symbol), action_symbol
+
     def _get_hand_type(self, hand):
         if hand.can_split:
             rank = hand.cards[0].rank
@@ -83,10 +124,10 @@ class BasicStrategy(Strategy):
 
     def _get_dealer_card(self, dealer_up_card):
         rank = dealer_up_card.rank
-        if rank.rank_value >= 10:
-            return "10"
-        elif rank == Rank.ACE:
+        if rank == Rank.ACE:
             return "A"
+        elif rank.rank_value >= 10:
+            return "10"
         else:
             return str(rank.rank_value)
 
@@ -102,27 +143,15 @@ class BasicStrategy(Strategy):
             return "H"  # Default to Hit if hand type not found
 
     def _map_action_symbol(self, symbol):
-        mapping = {
-            "H": Action.HIT,
-            "S": Action.STAND,
-            "D": Action.DOUBLE,
-            "DS": Action.DOUBLE,
-            "P": Action.SPLIT,
-            "R": Action.SURRENDER,
-        }
-        return mapping[symbol]
+        return _ACTION_SYMBOLS.get(symbol, Action.HIT)  # Default to HIT if unknown
 
     def decide_action(self, player, dealer_up_card: Card, game=None) -> Action:
         current_hand = player.current_hand
         hand_type = self._get_hand_type(current_hand)
         dealer_card = self._get_dealer_card(dealer_up_card)
-        action_symbol = self._get_action_from_strategy(hand_type, dealer_card)
-
-        try:
-            action = self._map_action_symbol(action_symbol)
-        except KeyError:
-            action = Action.HIT  # Default to HIT if unknown symbol
-
+        action, action_symbol = self._decisions.get(
+            (hand_type, dealer_card), _DEFAULT_DECISION
+        )
         final_action = self._get_valid_action(player, action, action_symbol)
 
         return final_action
@@ -200,20 +229,30 @@ class CountingStrategy(BasicStrategy):
         self.count = 0
         self.true_count = 0
         self.decks_remaining = 6  # Assume 6 decks by default
+        # The visible card list already counted, and how far into it
+        self._counted_cards = None
+        self._counted_index = 0
 
     def update_count(self, card: Card):
-        if card.rank in [Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE, Rank.SIX]:
+        value = card.rank.rank_value
+        if value in _LOW_CARD_VALUES:
             self.count += 1
-        elif card.rank in [Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE]:
+        elif value in _HIGH_CARD_VALUES:
             self.count -= 1
 
     def calculate_true_count(self):
         self.true_count = self.count / self.decks_remaining
 
     def decide_action(self, player, dealer_up_card: Card, game) -> Action:
-        # Update count based on all visible cards
-        for card in game.visible_cards:
+        # Update count with the cards seen since the last decision; the game
+        # starts a fresh list each round
+        visible_cards = game.visible_cards
+        if visible_cards is not self._counted_cards:
+            self._counted_cards = visible_cards
+            self._counted_index = 0
+        for card in visible_cards[self._counted_index :]:
             self.update_count(card)
+        self._counted_index = len(visible_cards)
 
         # Calculate true count
         self.calculate_true_count()
@@ -314,20 +353,15 @@ class AggressiveStrategy(BasicStrategy):
         if current_hand.is_blackjack:
             return Action.STAND
 
-        actions = [
-            self._decide_on_split,
-            self._decide_on_double,
-            self._decide_on_surrender,
-            self._decide_on_stand_or_hit,
-        ]
-
-        for action_method in actions:
-            action = action_method(current_hand, dealer_up_card)
-            if action is not None:
-                return action
-
-        # If no action was decided, default to hit
-        return Action.HIT
+        # Try each decision in turn; the first one that returns an action wins.
+        # Chained directly so no list of bound methods is built per decision.
+        return (
+            self._decide_on_split(current_hand, dealer_up_card)
+            or self._decide_on_double(current_hand, dealer_up_card)
+            or self._decide_on_surrender(current_hand, dealer_up_card)
+            or self._decide_on_stand_or_hit(current_hand, dealer_up_card)
+            or Action.HIT  # If no action was decided, default to hit
+        )
 
     def _decide_on_split(self, current_hand, dealer_up_card: Card) -> Optional[Action]:
         if not current_hand.can_split:
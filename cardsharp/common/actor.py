@@ -33,9 +33,12 @@ class Actor(ABC):
     :param deck: The deck of cards the actor uses
     """
 
+    # The hand type the actor starts with; subclasses override it
+    hand_class = Hand
+
     def __init__(self, name: str, io_interface: IOInterface, initial_money: int = 1000):
         self.name = name
-        self.hands = [Hand()]
+        self.hands = [self.hand_class()]
         self.money = initial_money
         self.io_interface = io_interface
         self.current_hand_index = 0
@@ -65,7 +68,7 @@ class Actor(ABC):
         """
 
     @abstractmethod
-    async def display_message(self, message: str):
+    def display_message(self, message: str):
         """
         Display a message from the actor.
 
@@ -85,7 +88,7 @@ class SimplePlayer(Actor):
 
         :return: None
         """
-        self.hands = [Hand()]
+        self.hands = [self.hand_class()]
         self.current_hand_index = 0  # reset current hand index as well
         self.money = 1000
 
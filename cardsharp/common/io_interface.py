@@ -6,12 +6,14 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 
-import aiofiles
-
 from cardsharp.blackjack.action import Action
 
+# Lowercase action name to Action, used to parse console input
+_ACTIONS_BY_NAME = {action.name.lower(): action for action in Action}
+
 
 class IOInterface(ABC):
     """
@@ -20,30 +22,41 @@ class IOInterface(ABC):
     Methods
     -------
     @abstractmethod
-    async def output(self, message: str):
+    def output(self, message: str):
         Output a message to the interface.
 
     @abstractmethod
-    async def get_player_action(self, player: "Actor"):
+    def get_player_action(self, player: "Actor"):
         Retrieve an action from a player.
 
     @abstractmethod
-    async def check_numeric_response(self, ctx):
+    def check_numeric_response(self, ctx):
         Check if a response is numeric.
+
+    def output_many(self, messages: list[str]):
+        Output several messages to the interface in one call.
     """
 
+    # True when output is thrown away, so callers can skip formatting it
+    discards_output = False
+
     @abstractmethod
-    async def output(self, message: str):
+    def output(self, message: str):
         """Output a message to the interface."""
 
+    def output_many(self, messages: list[str]):
+        """Output several messages to the interface in one call."""
+        for message in messages:
+            self.output(message)
+
     @abstractmethod
-    async def get_player_action(
+    def get_player_action(
         self, player: "Actor", valid_actions: list[Action]  # type: ignore # noqa: F821
     ) -> Action:
         """Retrieve an action from a player."""
 
     @abstractmethod
-    async def check_numeric_response(self, ctx):
+    def check_numeric_response(self, ctx):
         """Check if a response is numeric."""
 
 
@@ -56,6 +69,9 @@ class DummyIOInterface(IOInterface):
     def output(self, message):
         Simulates output operation.
 
+    def output_many(self, messages):
+        Simulates output of several messages.
+
     def get_player_action(self, player, actions) -> str:
         Retrieve an action from a player.
 
@@ -63,10 +79,16 @@ class DummyIOInterface(IOInterface):
         Simulates numeric response check.
     """
 
+    discards_output = True
+
     def output(self, message):
         """Simulates output operation."""
         pass
 
+    def output_many(self, messages):
+        """Simulates output of several messages."""
+        pass
+
     def get_player_action(
         self, player: "Actor", valid_actions: list[Action]  # type: ignore # noqa: F821
     ) -> Action:
@@ -82,19 +104,22 @@ class TestIOInterface(IOInterface):
 
     Methods
     -------
-    async def output(self, message):
+    def output(self, message):
         Collect an output message.
 
+    def output_many(self, messages):
+        Collect several output messages.
+
     def add_player_action(self, action: str):
         Add a player action to the queue.
 
-    async def get_player_action(self, player: "Actor") -> str:
+    def get_player_action(self, player: "Actor") -> str:
         Retrieve an action from a player.
 
-    async def check_numeric_response(self, ctx):
+    def check_numeric_response(self, ctx):
         Simulates numeric response check.
 
-    async def prompt_user_action(self, player: "Actor", valid_actions: list[str]) -> str:
+    def prompt_user_action(self, player: "Actor", valid_actions: list[str]) -> str:
         Prompt a player for an action.
     """
 
@@ -102,11 +127,14 @@ class TestIOInterface(IOInterface):
 
     def __init__(self):
         self.sent_messages = []
-        self.player_actions = []
+        self.player_actions = deque()
 
     def output(self, message):
         self.sent_messages.append(message)
 
+    def output_many(self, messages):
+        self.sent_messages.extend(messages)
+
     def add_player_action(self, action: Action):
         """Add a player action to the queue."""
         self.player_actions.append(action)
@@ -115,7 +143,7 @@ class TestIOInterface(IOInterface):
         self, player: "Actor", valid_actions: list[Action]  # type: ignore # noqa: F821
     ) -> Action:
         if self.player_actions:
-            return self.player_actions.pop(0)
+            return self.player_actions.popleft()
         else:
             raise ValueError("No more actions left in TestIOInterface queue.")
 
@@ -138,6 +166,9 @@ class ConsoleIOInterface(IOInterface):
     def output(self, message: str):
         Output a message to the console.
 
+    def output_many(self, messages: list[str]):
+        Output several messages to the console with a single write.
+
     def get_player_action(self, player: "Actor", valid_actions: list[str]):
         Retrieve an action from a player and check if it's valid.
 
@@ -148,20 +179,25 @@ class ConsoleIOInterface(IOInterface):
     def output(self, message: str):
         print(message)
 
+    def output_many(self, messages: list[str]):
+        if messages:
+            print("\n".join(messages))
+
     def get_player_action(
         self, player: "Actor", valid_actions: list[Action]  # type: ignore # noqa: F821
     ) -> Action:
+        prompt = f"{player.name}, it's your turn. What's your action? "
+        invalid_message = (
+            f"Invalid action, valid actions are: "
+            f"{', '.join(a.name for a in valid_actions)}"
+        )
         attempts = 0
         while attempts < 3:  # Setting a maximum number of attempts
-            action_input = input(
-                f"{player.name}, it's your turn. What's your action? "
-            ).lower()
-            for action in Action:
-                if action_input == action.name.lower() and action in valid_actions:
-                    return action
-            print(
-                f"Invalid action, valid actions are: {', '.join([a.name for a in valid_actions])}"
-            )
+            action_input = input(prompt).lower()
+            action = _ACTIONS_BY_NAME.get(action_input)
+            if action in valid_actions:
+                return action
+            print(invalid_message)
             attempts += 1
         raise Exception("Too many invalid attempts. Game aborted.")
 
@@ -183,34 +219,61 @@ class LoggingIOInterface(IOInterface):
 
     Methods
     -------
-    async def output(self, message):
+    def output(self, message):
         Write an output message to the log file.
 
-    async def get_player_action(self, player: "Actor") -> str:
+    def output_many(self, messages):
+        Write several output messages to the log file with a single write.
+
+    def get_player_action(self, player: "Actor") -> str:
         Retrieve an action from a player.
 
-    async def check_numeric_response(self, ctx):
+    def check_numeric_response(self, ctx):
         Simulates numeric response check.
+
+    def close(self):
+        Close the log file if it has been opened.
+
+    with LoggingIOInterface(path) as io_interface:
+        Close the log file when the block exits.
     """
 
     def __init__(self, log_file_path):
         self.log_file_path = log_file_path
+        self._log_file = None
+
+    def output(self, message):
+        self._write(message + "\n")
+
+    def output_many(self, messages):
+        if messages:
+            self._write("\n".join(messages) + "\n")
+
+    def _write(self, text):
+        """Write text to the log file, opening it on first use and keeping it open."""
+        if self._log_file is None:
+            self._log_file = open(self.log_file_path, mode="a", encoding="utf-8")
+        self._log_file.write(text)
+
+    def close(self):
+        """Close the log file if it has been opened."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def __enter__(self):
+        return self
 
-    async def output(self, message):
-        async with aiofiles.open(
-            self.log_file_path, mode="a", encoding="utf-8"
-        ) as log_file:
-            await log_file.write(message + "\n")
-        await asyncio.sleep(0)  # Yield control to the event loop
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
-    async def get_player_action(
+    def get_player_action(
         self, player: "Actor", valid_actions: list[Action]  # type: ignore # noqa: F821
     ) -> Action:
-        await asyncio.sleep(0)
         return player.decide_action(valid_actions)
 
-    async def check_numeric_response(self, ctx):
-        await asyncio.sleep(0)  # Simulate asynchronous behavior
+    def check_numeric_response(self, ctx):
+        pass
 
 
 class AsyncIOInterfaceWrapper:
@@ -224,22 +287,30 @@ class AsyncIOInterfaceWrapper:
 
     def __init__(self, io_interface):
         self.io_interface = io_interface
-        self.executor = ThreadPoolExecutor()
+        self._executor = None
 
-    async def output(self, message: str):
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool running the wrapped interface, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor()
+        return self._executor
+
+    async def _run(self, func, *args):
+        """Run a synchronous interface method on the executor and await it."""
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(self.executor, self.io_interface.output, message)
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def output(self, message: str):
+        await self._run(self.io_interface.output, message)
+
+    async def output_many(self, messages: list[str]):
+        await self._run(self.io_interface.output_many, messages)
 
     async def get_player_action(self, player, valid_actions):
-        loop = asyncio.get_running_loop()
-        action = await loop.run_in_executor(
-            self.executor, self.io_interface.get_player_action, player, valid_actions
+        return await self._run(
+            self.io_interface.get_player_action, player, valid_actions
         )
-        return action
 
     async def check_numeric_response(self, ctx):
-        loop = asyncio.get_running_loop()
-        numeric_response = await loop.run_in_executor(
-            self.executor, self.io_interface.check_numeric_response, ctx
-        )
-        return numeric_response
+        return await self._run(self.io_interface.check_numeric_response, ctx)
@@ -1,3 +1,4 @@
+import copy
 from typing import List, Union
 from cardsharp.common.card import Card
 from cardsharp.common.deck import Deck
@@ -63,6 +64,18 @@ class Shoe:
 
         return dealt_cards[0] if num_cards == 1 else dealt_cards
 
+    def copy(self) -> "Shoe":
+        """
+        Return a copy of the shoe with the same card order and dealing position.
+
+        Cards are never mutated once created, so the copy shares the Card objects
+        and only duplicates the list holding them, which is much cheaper than
+        a deepcopy of the whole shoe.
+        """
+        shoe = copy.copy(self)
+        shoe.cards = self.cards.copy()
+        return shoe
+
     @property
     def cards_remaining(self) -> int:
         """Return the number of cards remaining in the shoe."""
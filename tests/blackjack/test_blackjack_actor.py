@@ -571,3 +571,14 @@ def test_hand_value_with_multiple_aces(player):
     player.add_card(Card(Suit.CLUBS, Rank.ACE))
 
     assert player.current_hand.value() == 13
+
+
+def test_actors_start_with_blackjack_hand(player, dealer):
+    assert isinstance(player.current_hand, BlackjackHand)
+    assert isinstance(dealer.current_hand, BlackjackHand)
+    assert len(player.hands) == 1 and len(dealer.hands) == 1
+
+    player.reset()
+    dealer.reset()
+    assert isinstance(player.current_hand, BlackjackHand)
+    assert isinstance(dealer.current_hand, BlackjackHand)
@@ -0,0 +1,15 @@
+import pickle
+
+from cardsharp.blackjack.rules import Rules
+
+
+def test_rules_can_be_pickled():
+    # Simulations send Rules to worker processes
+    rules = pickle.loads(pickle.dumps(Rules()))
+    assert rules.bonus_payouts == {}
+
+
+def test_rules_do_not_share_default_bonus_payouts():
+    rules = Rules()
+    rules.bonus_payouts["777"] = 3.0
+    assert Rules().bonus_payouts == {}
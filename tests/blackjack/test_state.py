@@ -0,0 +1,51 @@
+import threading
+
+from cardsharp.blackjack.actor import Player
+from cardsharp.blackjack.blackjack import BlackjackGame
+from cardsharp.blackjack.rules import Rules
+from cardsharp.blackjack.state import PlacingBetsState
+from cardsharp.blackjack.strategy import DealerStrategy
+from cardsharp.common.io_interface import TestIOInterface
+
+
+def start_waiting_handler(game, monkeypatch):
+    waiting_state = game.current_state
+    condition = waiting_state._player_joined
+    waiting = threading.Event()
+    wait_for = condition.wait_for
+
+    def signalling_wait_for(predicate):
+        # Called with the lock held, which wait_for only releases once it
+        # blocks, so add_player cannot notify before the handler waits
+        waiting.set()
+        return wait_for(predicate)
+
+    monkeypatch.setattr(condition, "wait_for", signalling_wait_for)
+    handler = threading.Thread(target=waiting_state.handle, args=(game,), daemon=True)
+    handler.start()
+    assert waiting.wait(timeout=1), "Handler never started waiting"
+    return handler
+
+
+def test_waiting_for_players_wakes_on_join(monkeypatch):
+    game = BlackjackGame(Rules(), TestIOInterface())
+    handler = start_waiting_handler(game, monkeypatch)
+
+    game.add_player(Player("Alice", game.io_interface, DealerStrategy()))
+    handler.join(timeout=1)
+
+    assert not handler.is_alive()
+    assert isinstance(game.current_state, PlacingBetsState)
+
+
+def test_waiting_for_players_wakes_on_lower_minimum(monkeypatch):
+    game = BlackjackGame(Rules(), TestIOInterface())
+    game.minimum_players = 2
+    game.add_player(Player("Alice", game.io_interface, DealerStrategy()))
+    handler = start_waiting_handler(game, monkeypatch)
+
+    game.minimum_players = 1
+    handler.join(timeout=1)
+
+    assert not handler.is_alive()
+    assert isinstance(game.current_state, PlacingBetsState)
@@ -0,0 +1,75 @@
+from unittest.mock import Mock
+
+from cardsharp.blackjack.action import Action
+from cardsharp.blackjack.hand import BlackjackHand
+from cardsharp.blackjack.strategy import (
+    AggressiveStrategy,
+    BasicStrategy,
+    CountingStrategy,
+)
+from cardsharp.common.card import Card, Rank, Suit
+
+
+def test_counting_strategy_counts_each_visible_card_once():
+    strategy = CountingStrategy()
+    player = Mock()
+    player.bets = [10]
+    player.money = 100
+    player.current_hand = BlackjackHand()
+    player.current_hand.add_card(Card(Suit.HEARTS, Rank.TEN))
+    player.current_hand.add_card(Card(Suit.CLUBS, Rank.SEVEN))
+    player.valid_actions = [Action.HIT, Action.STAND]
+    dealer_up_card = Card(Suit.DIAMONDS, Rank.NINE)
+    game = Mock()
+    game.visible_cards = [Card(Suit.HEARTS, Rank.TWO), Card(Suit.SPADES, Rank.FIVE)]
+
+    strategy.decide_action(player, dealer_up_card, game)
+    strategy.decide_action(player, dealer_up_card, game)
+    assert strategy.count == 2
+
+    game.visible_cards.append(Card(Suit.SPADES, Rank.THREE))
+    strategy.decide_action(player, dealer_up_card, game)
+    assert strategy.count == 3
+
+    # A new round starts a fresh visible card list
+    game.visible_cards = [Card(Suit.CLUBS, Rank.KING)]
+    strategy.decide_action(player, dealer_up_card, game)
+    assert strategy.count == 2
+
+
+def test_basic_strategy_reads_ace_column_for_dealer_ace():
+    strategy = BasicStrategy()
+    player = Mock()
+    player.current_hand = BlackjackHand()
+    player.current_hand.add_card(Card(Suit.HEARTS, Rank.SIX))
+    player.current_hand.add_card(Card(Suit.CLUBS, Rank.FIVE))
+    player.valid_actions = [Action.HIT, Action.STAND, Action.DOUBLE]
+
+    # Hard 11 doubles against a ten but only hits against an ace
+    assert (
+        strategy.decide_action(player, Card(Suit.DIAMONDS, Rank.KING)) == Action.DOUBLE
+    )
+    assert strategy.decide_action(player, Card(Suit.DIAMONDS, Rank.ACE)) == Action.HIT
+
+
+def test_aggressive_strategy_takes_first_decision():
+    strategy = AggressiveStrategy()
+    player = Mock()
+    player.current_hand = BlackjackHand()
+    player.current_hand.add_card(Card(Suit.HEARTS, Rank.EIGHT))
+    player.current_hand.add_card(Card(Suit.CLUBS, Rank.EIGHT))
+    dealer_up_card = Card(Suit.DIAMONDS, Rank.SIX)
+
+    assert strategy.decide_action(player, dealer_up_card) == Action.SPLIT
+
+    player.current_hand = BlackjackHand()
+    player.current_hand.add_card(Card(Suit.HEARTS, Rank.TEN))
+    player.current_hand.add_card(Card(Suit.CLUBS, Rank.SEVEN))
+    assert strategy.decide_action(player, dealer_up_card) == Action.STAND
+
+
+def test_basic_strategy_loads_each_chart_once():
+    first = BasicStrategy()
+    second = BasicStrategy()
+    assert second.strategy is first.strategy
+    assert second._decisions is first._decisions
@@ -69,3 +69,8 @@ def test_empty_hand_repr():
 def test_empty_hand_str():
     hand = Hand()
     assert str(hand) == ""
+
+
+def test_hand_uses_slots():
+    hand = Hand()
+    assert not hasattr(hand, "__dict__")
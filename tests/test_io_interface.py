@@ -1,10 +1,19 @@
+import asyncio
+
 import pytest
 from cardsharp.common.io_interface import (
     DummyIOInterface,
     TestIOInterface,
     ConsoleIOInterface,
+    LoggingIOInterface,
+    AsyncIOInterfaceWrapper,
 )
 from cardsharp.blackjack.action import Action
+from cardsharp.blackjack.actor import Player
+from cardsharp.blackjack.blackjack import BlackjackGame
+from cardsharp.blackjack.rules import Rules
+from cardsharp.blackjack.state import PlacingBetsState
+from cardsharp.blackjack.strategy import BasicStrategy
 
 
 class MockPlayer:
@@ -21,6 +30,7 @@ def test_dummy_io_interface_methods():
     player = MockPlayer(name="Test")
 
     assert interface.output("Test") is None
+    assert interface.discards_output is True
     assert (
         interface.get_player_action(player, player.available_actions)
         == player.available_actions[0]
@@ -51,6 +61,15 @@ def test_console_io_interface_methods(mocker):
     )
 
 
+def test_console_io_interface_output_many(capsys):
+    interface = ConsoleIOInterface()
+
+    interface.output_many(["First line", "Second line"])
+    interface.output_many([])
+
+    assert capsys.readouterr().out == "First line\nSecond line\n"
+
+
 def test_test_io_interface_methods():
     interface = TestIOInterface()
 
@@ -58,6 +77,10 @@ def test_test_io_interface_methods():
     interface.output("Test")
     assert interface.sent_messages == ["Test"]
 
+    # Test output_many method
+    interface.output_many(["Second", "Third"])
+    assert interface.sent_messages == ["Test", "Second", "Third"]
+
     # Test add_player_action and get_player_action methods
     interface.add_player_action("action1")
     assert interface.get_player_action(None, ["action1", "action2"]) == "action1"
@@ -71,3 +94,54 @@ def test_test_io_interface_methods():
     # Test prompt_user_action method
     interface.add_player_action("action2")
     assert interface.prompt_user_action(None, ["action1", "action2"]) == "action2"
+
+
+def test_logging_io_interface_reuses_log_file(tmp_path):
+    log_path = tmp_path / "game.log"
+
+    with LoggingIOInterface(str(log_path)) as interface:
+        interface.output("first")
+        log_file = interface._log_file
+        interface.output("second")
+        assert interface._log_file is log_file
+
+    assert interface._log_file is None
+    assert log_path.read_text(encoding="utf-8") == "first\nsecond\n"
+
+
+def test_logging_io_interface_output_many(tmp_path):
+    log_path = tmp_path / "game.log"
+
+    with LoggingIOInterface(str(log_path)) as interface:
+        interface.output_many(["first", "second"])
+        interface.output_many([])
+
+    assert log_path.read_text(encoding="utf-8") == "first\nsecond\n"
+
+
+def test_logging_io_interface_logs_a_round(tmp_path):
+    log_path = tmp_path / "game.log"
+
+    with LoggingIOInterface(str(log_path)) as interface:
+        game = BlackjackGame(Rules(), interface)
+        game.add_player(Player("Alice", interface, BasicStrategy()))
+        game.set_state(PlacingBetsState())
+        game.play_round()
+
+    log = log_path.read_text(encoding="utf-8")
+    assert "Alice has joined the game." in log
+    assert "Changing state to" in log
+
+
+def test_async_io_interface_wrapper_creates_executor_on_first_use():
+    io_interface = TestIOInterface()
+    wrapper = AsyncIOInterfaceWrapper(io_interface)
+    assert wrapper._executor is None
+
+    asyncio.run(wrapper.output("hello"))
+
+    executor = wrapper._executor
+    assert executor is not None
+    assert wrapper.executor is executor
+    assert io_interface.sent_messages == ["hello"]
+    executor.shutdown()
@@ -0,0 +1,23 @@
+from cardsharp.common.shoe import Shoe
+
+
+def test_shoe_copy_preserves_order_and_position():
+    shoe = Shoe(num_decks=1)
+    shoe.deal(5)
+
+    shoe_copy = shoe.copy()
+
+    assert shoe_copy.cards == shoe.cards
+    assert shoe_copy.next_card_index == shoe.next_card_index
+    assert shoe_copy.deal() == shoe.deal()
+
+
+def test_shoe_copy_is_independent():
+    shoe = Shoe(num_decks=1)
+    shoe_copy = shoe.copy()
+
+    shoe_copy.shuffle()
+    shoe_copy.deal(3)
+
+    assert shoe_copy.cards is not shoe.cards
+    assert shoe.next_card_index == 0